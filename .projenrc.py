@@ -31,39 +31,46 @@ metaflow_cdk_package = AwsCdkPythonApp(
     name="awscdk-metaflow",
     outdir="awscdk-metaflow",
     module_name="cdk_metaflow",
-    cdk_version="2.45.0",
+    # floor set by MetadataDatabase's Aurora Serverless v2 support:
+    # ClusterInstance.serverless_v2 + serverless_v2_*_capacity need >= 2.82
+    cdk_version="2.82.0",
     author_email="eric.russia97@gmail.com",
     author_name="The MLOps Club",
     version="0.0.0",
     venv_options=VenvOptions(envdir="../venv"),
-    deps=["pydantic"],
+    deps=[],
     dev_deps=["metaflow"],
     parent=repo,
 )
+# the package uses dataclass(slots=True) and PEP 604 unions, so the generated
+# setup.cfg must declare python_requires >= 3.10 (flow.py pins 3.10.4 already)
 SetupPy(project=metaflow_cdk_package)
 
+# serialize the settings body once; both TemplatizedFiles below share the same JSON payload
+vscode_settings_body = json.dumps(
+    {
+        "restructuredtext.confPath": "",
+        "autoDocstring.customTemplatePath": "./.vscode/python-docstring-template.mustache",
+        "python.linting.pylintEnabled": True,
+        "python.linting.pylintArgs": ["--rcfile=./linting/.pylintrc"],
+        "python.formatting.provider": "black",
+        "python.formatting.blackArgs": ["--line-length=112"],
+        "python.linting.flake8Enabled": True,
+        "python.linting.flake8Args": [
+            "--config==./linting/.flake8",
+            "--max-line-length=112",
+        ],
+        "editor.formatOnSave": True,
+    },
+    indent=4,
+)
+
 vscode_settings_kwargs = dict(
     project=repo,
     file_path=".vscode/example-settings.json",
     make_comment_fn=lambda line: f"// {line}",
     supports_comments=True,
-    template_body=json.dumps(
-        {
-            "restructuredtext.confPath": "",
-            "autoDocstring.customTemplatePath": "./.vscode/python-docstring-template.mustache",
-            "python.linting.pylintEnabled": True,
-            "python.linting.pylintArgs": ["--rcfile=./linting/.pylintrc"],
-            "python.formatting.provider": "black",
-            "python.formatting.blackArgs": ["--line-length=112"],
-            "python.linting.flake8Enabled": True,
-            "python.linting.flake8Args": [
-                "--config==./linting/.flake8",
-                "--max-line-length=112",
-            ],
-            "editor.formatOnSave": True,
-        },
-        indent=4,
-    ),
+    template_body=vscode_settings_body,
 )
 vscode_settings_json = TemplatizedFile(**vscode_settings_kwargs)
 vscode_settings_kwargs["is_sample"] = True
@@ -1,6 +1,14 @@
 import os
+
+# every construct (and every Lazy/Token inside the CDK libs) captures a stack trace
+# by default, which dominates synth CPU as the construct count grows; we never read
+# these traces, so turn the capture off. This must happen before the first aws_cdk
+# import: importing aws_cdk spawns the jsii Node child process, which inherits its
+# environment at spawn time, so setting the variable any later never reaches Node.
+os.environ.setdefault("CDK_DISABLE_STACK_TRACE", "1")
+
 from aws_cdk import App, Environment
-from cdk_metaflow.main import MetaflowStack
+from cdk_metaflow.main import MetaflowStack, MetaflowStage
 from cdk_metaflow.config import MetaflowStackConfig
 from functools import lru_cache
 import boto3
@@ -9,9 +17,22 @@ import boto3
 
 DEV_ENV = Environment(account=os.environ["AWS_ACCOUNT_ID"], region=os.getenv("AWS_REGION"))
 
-CONFIG = MetaflowStackConfig()
+
+@lru_cache(maxsize=1)
+def get_config() -> MetaflowStackConfig:
+    """Build the stack config on first use (and only once) rather than at module import."""
+    return MetaflowStackConfig.from_env()
+
+
 APP = App()
+APP.node.set_context("aws:cdk:disable-stack-trace", True)
 
-MetaflowStack(APP, "awscdk-metaflow-dev", config=CONFIG, env=DEV_ENV)
+if APP.node.try_get_context("split-stacks"):
+    # opt in with `cdk deploy -c split-stacks=true <stack>` to deploy/synth each
+    # piece (network/data/metadata/ui) independently; add `--exclusively` to skip
+    # staging/deploying the sibling stacks (they are still constructed in-process)
+    MetaflowStage(APP, "metaflow", config=get_config(), env=DEV_ENV)
+else:
+    MetaflowStack(APP, "awscdk-metaflow-dev", config=get_config(), env=DEV_ENV)
 
 APP.synth()
@@ -81,15 +81,16 @@ def make_batch_job_queue(
     priority: Optional[int] = 1
 ) -> batch.JobQueue:
     make_id: TNamerFn = make_namer_fn(id_prefix)
+    # hoist the attribute lookup out of the comprehension; enumerate() handles the
+    # 1-based ordering in C rather than with a per-element "idx + 1"
+    job_queue_compute_environment = batch.JobQueueComputeEnvironment
     return batch.JobQueue(
         scope=scope,
         id=make_id("job-queue"),
         enabled=True,
         compute_environments=[
-            batch.JobQueueComputeEnvironment(
-                compute_environment=comp_env, order=idx + 1
-            )
-            for idx, comp_env in enumerate(compute_environments)
+            job_queue_compute_environment(compute_environment=comp_env, order=order)
+            for order, comp_env in enumerate(compute_environments, start=1)
         ],
         priority=priority,
     )
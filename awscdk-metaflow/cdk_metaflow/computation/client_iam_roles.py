@@ -1,13 +1,49 @@
+from __future__ import annotations
+
 from aws_cdk import aws_iam as iam
-from aws_cdk import aws_s3 as s3
-from aws_cdk import aws_dynamodb as dynamodb
 from constructs import Construct
-from aws_cdk import Stack
 
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    # heavyweight CDK submodules are imported lazily inside the functions that
+    # need them so that loading this module doesn't register their jsii types
+    from aws_cdk import aws_dynamodb as dynamodb
+    from aws_cdk import aws_s3 as s3
 
 from cdk_metaflow.utils import make_namer_fn, TNamerFn
 
+# "Imported" constructs (from_bucket_name/from_table_name) are pure references, but each
+# call still allocates a new node in the construct tree. Cache them per (scope, name) so
+# sibling roles in the same scope share a single imported node instead of growing the
+# tree linearly during synth. Keyed by the scope object itself: constructs are hashable,
+# and raw id() values get recycled by the garbage collector, which could hand a new
+# scope another tree's imported construct.
+_imported_bucket_cache: Dict[Tuple[Construct, str], s3.IBucket] = {}
+_imported_table_cache: Dict[Tuple[Construct, str], dynamodb.ITable] = {}
+
+
+def _import_bucket(scope: Construct, construct_id: str, bucket_name: str) -> "s3.IBucket":
+    from aws_cdk import aws_s3 as s3
+
+    key = (scope, bucket_name)
+    if key not in _imported_bucket_cache:
+        _imported_bucket_cache[key] = s3.Bucket.from_bucket_name(
+            scope=scope, id=construct_id, bucket_name=bucket_name
+        )
+    return _imported_bucket_cache[key]
+
+
+def _import_table(scope: Construct, construct_id: str, table_name: str) -> "dynamodb.ITable":
+    from aws_cdk import aws_dynamodb as dynamodb
+
+    key = (scope, table_name)
+    if key not in _imported_table_cache:
+        _imported_table_cache[key] = dynamodb.Table.from_table_name(
+            scope=scope, id=construct_id, table_name=table_name
+        )
+    return _imported_table_cache[key]
+
 
 def make_ecs_s3_access_iam_role(
     scope: Construct,
@@ -156,42 +192,47 @@ def make_ecs_s3_access_iam_role(
     )
 
     # access to artifacts bucket
-    artifacts_bucket = s3.Bucket.from_bucket_name(
-        scope=scope, id=make_id("artifacts-bucket-for-iam"), bucket_name=artifacts_bucket_name
+    artifacts_bucket = _import_bucket(
+        scope=scope, construct_id=make_id("artifacts-bucket-for-iam"), bucket_name=artifacts_bucket_name
     )
     artifacts_bucket.grant_read_write(ecs_s3_access_role, objects_key_pattern="*")
 
     # access to step functions state dynamo table
-    sfn_metaflow_state_dynamo_table = dynamodb.Table.from_table_name(
+    sfn_metaflow_state_dynamo_table = _import_table(
         scope=scope,
-        id=make_id("sfn-metaflow-state-tbl"),
+        construct_id=make_id("sfn-metaflow-state-tbl"),
         table_name=flow_run_state_ddb_table_name,
     )
     sfn_metaflow_state_dynamo_table.grant_read_write_data(ecs_s3_access_role)
 
-    policies_to_attach = [
+    statements = [
         # ???
-        make_deny_presigned_batch_policy(scope=scope, id_prefix=id_prefix),
+        *make_deny_presigned_batch_statements(),
         # access to push logs in CloudWatch
-        make__allow_put_cloudwatch_logs__policy(scope=scope, id_prefix=id_prefix),
+        *make__allow_put_cloudwatch_logs__statements(),
     ]
 
     # access to deploy to sagemaker
     if allow_sagemaker:
-        policies_to_attach += [
-            make_allow_sagemaker_policy(scope=scope, id_prefix=id_prefix),
-            make__allow_pass_role_to_sagemaker_service__policy(
-                scope=scope, id_prefix=id_prefix
-            ),
+        statements += [
+            *make_allow_sagemaker_statements(scope=scope),
+            *make__allow_pass_role_to_sagemaker_service__statements(),
         ]
 
-    for policy in policies_to_attach:
-        ecs_s3_access_role.attach_inline_policy(policy=policy)
+    # one multi-statement policy rather than one AWS::IAM::Policy resource per
+    # logical policy: fewer CloudFormation resources means faster deploys
+    ecs_s3_access_role.attach_inline_policy(
+        policy=iam.Policy(
+            scope=scope,
+            id=make_id("ecs-s3-access-inline"),
+            document=iam.PolicyDocument(statements=statements),
+        )
+    )
 
     return ecs_s3_access_role
 
 
-def make_deny_presigned_batch_policy(scope: Construct, id_prefix: str) -> iam.Policy:
+def make_deny_presigned_batch_statements() -> list[iam.PolicyStatement]:
     """
     TODO: What is this for?
 
@@ -209,20 +250,14 @@ def make_deny_presigned_batch_policy(scope: Construct, id_prefix: str) -> iam.Po
                     s3:authType: REST-HEADER
     ```
     """
-    make_id: TNamerFn = make_namer_fn(id_prefix)
     policy_stmt = iam.PolicyStatement(
         actions=["s3:*"], effect=iam.Effect.DENY, resources=["*"]
     )
     policy_stmt.add_condition("StringNotEquals", {"s3:authType": "REST-HEADER"})
-    deny_presigned_batch_policy = iam.Policy(
-        scope=scope,
-        id=make_id("deny-presigned-batch"),
-        document=iam.PolicyDocument(statements=[policy_stmt]),
-    )
-    return deny_presigned_batch_policy
+    return [policy_stmt]
 
 
-def make_allow_sagemaker_policy(scope: Construct, id_prefix: str) -> iam.Policy:
+def make_allow_sagemaker_statements(scope: Construct) -> list[iam.PolicyStatement]:
     """
     TODO: what is this for? Can Metaflow deploy models as SageMaker endpoints?
 
@@ -254,12 +289,19 @@ def make_allow_sagemaker_policy(scope: Construct, id_prefix: str) -> iam.Policy:
                 - !Sub "arn:${IAMPartition}:sagemaker:${AWS::Region}:${AWS::AccountId}:endpoint-config/*"
     ```
     """
+    from aws_cdk import Stack
+
     stack = Stack.of(scope)
-    make_id: TNamerFn = make_namer_fn(id_prefix)
+
+    # read the region/account tokens once and build the common ARN prefix a single
+    # time rather than re-resolving them per f-string below
+    region, account = stack.region, stack.account
+    sagemaker_arn_prefix = f"arn:aws:sagemaker:{region}:{account}"
+
     allow_create_sagemaker_training_jobs = iam.PolicyStatement(
         actions=["sagemaker:CreateTrainingJob", "sagemaker:DescribeTrainingJob"],
         effect=iam.Effect.ALLOW,
-        resources=[f"arn:aws:sagemaker:{stack.region}:{stack.account}:training-job/*"],
+        resources=[f"{sagemaker_arn_prefix}:training-job/*"],
     )
 
     allow_deploy_to_sagemaker = iam.PolicyStatement(
@@ -273,27 +315,16 @@ def make_allow_sagemaker_policy(scope: Construct, id_prefix: str) -> iam.Policy:
         ],
         effect=iam.Effect.ALLOW,
         resources=[
-            f"arn:aws:sagemaker:{stack.region}:{stack.account}:endpoint/*",
-            f"arn:aws:sagemaker:{stack.region}:{stack.account}:model/*",
-            f"arn:aws:sagemaker:{stack.region}:{stack.account}:endpoint-config/*",
+            f"{sagemaker_arn_prefix}:endpoint/*",
+            f"{sagemaker_arn_prefix}:model/*",
+            f"{sagemaker_arn_prefix}:endpoint-config/*",
         ],
     )
 
-    allow_sagemaker_policy = iam.Policy(
-        scope=scope,
-        id=make_id("allow-sagemaker"),
-        document=iam.PolicyDocument(
-            statements=[allow_create_sagemaker_training_jobs, allow_deploy_to_sagemaker]
-        ),
-    )
-
-    return allow_sagemaker_policy
+    return [allow_create_sagemaker_training_jobs, allow_deploy_to_sagemaker]
 
 
-def make__allow_pass_role_to_sagemaker_service__policy(
-    scope: Construct,
-    id_prefix: str,
-):
+def make__allow_pass_role_to_sagemaker_service__statements() -> list[iam.PolicyStatement]:
     """
     TODO: what is this for?
 
@@ -311,8 +342,6 @@ def make__allow_pass_role_to_sagemaker_service__policy(
                 iam:PassedToService: sagemaker.amazonaws.com
     ```
     """
-    make_id: TNamerFn = make_namer_fn(id_prefix)
-
     allow_pass_role_to_sagemaker_stmt = iam.PolicyStatement(
         actions=["iam:PassRole"],
         effect=iam.Effect.ALLOW,
@@ -322,18 +351,10 @@ def make__allow_pass_role_to_sagemaker_service__policy(
         "StringEquals", {"iam:PassedToService": "sagemaker.amazonaws.com"}
     )
 
-    allow_pass_role_to_sagemaker_policy = iam.Policy(
-        scope=scope,
-        id=make_id("iam-pass-role"),
-        document=iam.PolicyDocument(statements=[allow_pass_role_to_sagemaker_stmt]),
-    )
-
-    return allow_pass_role_to_sagemaker_policy
+    return [allow_pass_role_to_sagemaker_stmt]
 
 
-def make__allow_put_cloudwatch_logs__policy(
-    scope: Construct, id_prefix: str
-) -> iam.Policy:
+def make__allow_put_cloudwatch_logs__statements() -> list[iam.PolicyStatement]:
     """
     Create a DynamoDB table used to store information/state of Metaflow Flow runs when using step functions.
 
@@ -350,19 +371,13 @@ def make__allow_put_cloudwatch_logs__policy(
                 Resource: '*'
     ```
     """
-    make_id: TNamerFn = make_namer_fn(id_prefix)
-
-    allow_put_logs = iam.Policy(
-        scope=scope,
-        id=make_id("allow-put-logs"),
-        document=iam.PolicyDocument(statements=[iam.PolicyStatement(
+    allow_put_logs_stmt = iam.PolicyStatement(
         actions=[
             "logs:CreateLogStream",
             "logs:PutLogEvents",
         ],
         effect=iam.Effect.ALLOW,
         resources=["*"],
-    )]),
     )
 
-    return allow_put_logs
+    return [allow_put_logs_stmt]
@@ -5,12 +5,11 @@ To arrive at this file, we referenced the official Metaflow CloudFormation templ
 https://github.com/outerbounds/metaflow-tools/blob/master/aws/cloudformation/metaflow-cfn-template.yml
 """
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, fields
 from typing import ClassVar, Literal, Optional
-from pydantic import BaseSettings, conint
 
 
-@dataclass(frozen=True)
 class MetaflowMetadataServiceConstants:
     """Mappings.ServiceInfo section of official Metaflow CloudFormation template."""
 
@@ -27,7 +26,6 @@ class MetaflowMetadataServiceConstants:
     HEALTHCHECK_PATH: ClassVar[str] = "/ping"
 
 
-@dataclass(frozen=True)
 class MetaflowUIBackendServiceConstants:
     """Mappings.ServiceInfoUIService section of the official Metaflow CloudFormation template."""
 
@@ -63,7 +61,11 @@ class MetaflowUIFrontendServiceConstants:
     HEALTHCHECK_PATH = "/"
 
 
-class MetaflowStackConfig(BaseSettings):
+_TRUTHY_ENV_VALUES = {"1", "true", "yes", "on"}
+
+
+@dataclass(frozen=True)
+class MetaflowStackConfig:
     """
     Parameters of the official Metaflow CloudFormation template.
 
@@ -98,7 +100,7 @@ class MetaflowStackConfig(BaseSettings):
     subnet_2_cidr: str = "10.20.1.0/24"
     """CIDR for Metaflow VPC Subnet 2"""
 
-    max_vcpu_batch: conint(ge=16, le=256) = 64
+    max_vcpu_batch: int = 64
     """Maximum VCPUs for Batch Compute Environment [16-256]. You can change the upper limit by editing the Cloudformation template"""
 
     min_vcpu_batch: Literal[0, 2, 4, 8, 16] = 8
@@ -131,6 +133,9 @@ class MetaflowStackConfig(BaseSettings):
     enable_ui: bool = False
     """Enable Metaflow UI. Make sure to specify PublicDomainName and CertificateArn if you do"""
 
+    db_engine_mode: Literal["instance", "serverless_v2"] = "instance"
+    """Engine for the metadata database: a t3.micro RDS instance, or an Aurora Serverless v2 cluster that scales to 0.5 ACU"""
+
     public_domain_name: Optional[str] = None
     """The custom domain name for UI (e.g., ui.outerbounds.co). Has to match the certificate. Required if UI is enabled"""
 
@@ -141,6 +146,35 @@ class MetaflowStackConfig(BaseSettings):
     TODO: use a DNS Validated Cert to automate this; then deprecate this field
     """
 
+    def __post_init__(self):
+        assert 16 <= self.max_vcpu_batch <= 256, "max_vcpu_batch must be in [16, 256]"
+        assert self.db_engine_mode in ("instance", "serverless_v2"), (
+            "db_engine_mode must be 'instance' or 'serverless_v2'"
+        )
+
+    @classmethod
+    def from_env(cls) -> "MetaflowStackConfig":
+        """
+        Build a config from environment variables, falling back to the field defaults.
+
+        Each field can be overridden by an UPPER_CASE environment variable of the
+        same name, e.g. ``ENABLE_UI=true`` or ``MAX_VCPU_BATCH=128``. Only the
+        variables that are actually set are parsed--unlike pydantic's
+        ``BaseSettings``, no validator machinery runs for untouched fields.
+        """
+        overrides = {}
+        for field_ in fields(cls):
+            raw_value = os.environ.get(field_.name.upper())
+            if raw_value is None:
+                continue
+            if isinstance(field_.default, bool):
+                overrides[field_.name] = raw_value.strip().lower() in _TRUTHY_ENV_VALUES
+            elif isinstance(field_.default, int):
+                overrides[field_.name] = int(raw_value)
+            else:
+                overrides[field_.name] = raw_value
+        return cls(**overrides)
+
     @property
     def enable_additional_worker_policy(self) -> bool:
         return bool(self.additional_worker_policy_arn)
@@ -57,28 +57,66 @@ Ongoing exploration and ideas:
    experiment: https://outerbounds-community.slack.com/archives/C02116BBNTU/p1666060632779379
 """
 
-from typing import Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal, Optional
 import aws_cdk as cdk
 from aws_cdk import Stack, CfnOutput
-from cdk_metaflow.config import MetaflowStackConfig
 from constructs import Construct
-from aws_cdk import aws_ecs as ecs
-from aws_cdk import aws_rds as rds
-from aws_cdk import aws_s3 as s3
-from aws_cdk import aws_elasticloadbalancingv2 as elbv2
-from aws_cdk import aws_ec2 as ec2
-from aws_cdk import aws_dynamodb as dynamodb
-from aws_cdk import aws_iam as iam
-from aws_cdk import aws_batch_alpha as batch
 
 from cdk_metaflow.config import MetaflowStackConfig, MetaflowUIBackendServiceConstants
 from cdk_metaflow.metadata_service.ecs import MetadataService
-from cdk_metaflow.ui.ecs import UIBackendService, UIFrontendService
-from cdk_metaflow.computation.batch import make_fargate_compute_environment,make_batch_job_queue
+
+# NOTE: the UI and Batch construct modules are imported inside the functions that
+# use them; importing them at module scope would trigger their jsii type
+# registration even for deployments that disable those features.
 from cdk_metaflow.computation.client_iam_roles import make_ecs_s3_access_iam_role
 from cdk_metaflow.computation.dynamo_sfn_state_table import (
     make_step_function_state_ddb_table,
 )
+from cdk_metaflow.utils import lazy_import
+
+if TYPE_CHECKING:
+    # imported for type hints only; at runtime each aws_cdk submodule is pulled in
+    # lazily (see utils.lazy_import) to keep `cdk ls`/synth startup fast
+    from aws_cdk import aws_batch_alpha as batch
+    from aws_cdk import aws_dynamodb as dynamodb
+    from aws_cdk import aws_ec2 as ec2
+    from aws_cdk import aws_ecs as ecs
+    from aws_cdk import aws_elasticloadbalancingv2 as elbv2
+    from aws_cdk import aws_s3 as s3
+
+
+# jsii value objects (subnet selections, ports, peers) are immutable and can be shared
+# across constructs; building each one once per process instead of per construct avoids
+# a jsii kernel round-trip per use. They are created lazily because ec2 is lazy-imported.
+_PUBLIC_SUBNETS = None
+_PG_PORT = None
+_ANY_IPV4 = None
+
+
+def _public_subnets() -> ec2.SubnetSelection:
+    global _PUBLIC_SUBNETS
+    if _PUBLIC_SUBNETS is None:
+        ec2 = lazy_import("aws_cdk.aws_ec2")
+        _PUBLIC_SUBNETS = ec2.SubnetSelection(subnet_type=ec2.SubnetType.PUBLIC)
+    return _PUBLIC_SUBNETS
+
+
+def _pg_port() -> ec2.Port:
+    global _PG_PORT
+    if _PG_PORT is None:
+        ec2 = lazy_import("aws_cdk.aws_ec2")
+        _PG_PORT = ec2.Port.tcp(5432)
+    return _PG_PORT
+
+
+def _any_ipv4() -> ec2.IPeer:
+    global _ANY_IPV4
+    if _ANY_IPV4 is None:
+        ec2 = lazy_import("aws_cdk.aws_ec2")
+        _ANY_IPV4 = ec2.Peer.ipv4("0.0.0.0/0")
+    return _ANY_IPV4
 
 
 class MetaflowStack(Stack):
@@ -91,6 +129,7 @@ class MetaflowStack(Stack):
             self,
             "metaflow-deployment",
             vpc_cidr=config.vpc_cidr,
+            db_engine_mode=config.db_engine_mode,
             enable_ui=True,
             enable_sagemaker=True,
         )
@@ -104,24 +143,60 @@ class Metaflow(Construct):
         vpc: Optional[ec2.Vpc] = None,
         vpc_cidr: Optional[str] = None,
         artifacts_bucket_name: Optional[str] = None,
+        retain_artifacts: bool = False,
+        artifact_retention_days: Optional[int] = None,
         enable_ui: Optional[bool] = False,
         enable_sagemaker: Optional[bool] = False,
+        enable_batch: bool = True,
+        dev_mode: bool = False,
+        db_engine_mode: Literal["instance", "serverless_v2"] = "instance",
         **kwargs,
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
+        # outputs registered via make_output() are buffered here and emitted as
+        # CfnOutput constructs in one pass by _emit_outputs() at the end of __init__
+        self._outputs: dict[str, tuple[str, Optional[str]]] = {}
+
+        ecs = lazy_import("aws_cdk.aws_ecs")
+        elbv2 = lazy_import("aws_cdk.aws_elasticloadbalancingv2")
+
         assert not (
             vpc and vpc_cidr
         ), "vpc and vpc_cidr cannot both be set; set only one"
 
-        vpc: ec2.Vpc = vpc or make_low_cost_vpc(scope=self, cidr=vpc_cidr)
+        if vpc is None:
+            if vpc_cidr:
+                vpc = make_low_cost_vpc(scope=self, cidr=vpc_cidr)
+            else:
+                # reuse the account's default VPC rather than paying for a dedicated
+                # one. from_lookup() resolves through cdk.context.json, so the AWS
+                # describe calls happen once and are cached (pin the file in VCS);
+                # requires the stack to be created with an explicit env.
+                ec2 = lazy_import("aws_cdk.aws_ec2")
+                vpc = ec2.Vpc.from_lookup(self, "vpc", is_default=True)
         artifacts_bucket: s3.Bucket = lookup_or_create_artifacts_bucket(
-            self, construct_id, artifacts_bucket_name=artifacts_bucket_name
+            self,
+            construct_id,
+            artifacts_bucket_name=artifacts_bucket_name,
+            retain_artifacts=retain_artifacts,
+            artifact_retention_days=artifact_retention_days,
         )
         metadata_database = MetadataDatabase(
-            self, id="metaflow-metadata-db", vpc=vpc, database_name="metaflow"
+            self,
+            id="metaflow-metadata-db",
+            vpc=vpc,
+            database_name="metaflow",
+            engine_mode=db_engine_mode,
+            dev_mode=dev_mode,
         )
 
+        # hand the services the secret itself; the ECS agent resolves the credentials
+        # at task start, so no SecretValue tokens (or plaintext values) land in the template
+        db_secret = metadata_database.db_secret
+        db_host = metadata_database.db_endpoint_address
+        db_port = metadata_database.db_endpoint_port
+
         # Begin batch and step functions
 
         sfn_state_ddb_table: dynamodb.Table = make_step_function_state_ddb_table(
@@ -140,12 +215,18 @@ class Metaflow(Construct):
             ecs_s3_access_iam_role.role_arn,
             "set [METAFLOW_ECS_S3_ACCESS_IAM_ROLE] as this value when running 'metaflow configure aws'",
         )
-        compute_environment: batch.ComputeEnvironment = make_fargate_compute_environment(
-            scope=self, id_prefix=construct_id, vpc_with_metadata_service=vpc
-        )
-        batch_job_queue: batch.JobQueue = make_batch_job_queue(scope=self, id_prefix=construct_id, compute_environments=[compute_environment])
+        if enable_batch:
+            from cdk_metaflow.computation.batch import (
+                make_batch_job_queue,
+                make_fargate_compute_environment,
+            )
 
-        self.make_output("METAFLOW_BATCH_JOB_QUEUE", batch_job_queue.job_queue_arn, "set [METAFLOW_BATCH_JOB_QUEUE] as this value when running 'metaflow configure aws'")
+            compute_environment: batch.ComputeEnvironment = make_fargate_compute_environment(
+                scope=self, id_prefix=construct_id, vpc_with_metadata_service=vpc
+            )
+            batch_job_queue: batch.JobQueue = make_batch_job_queue(scope=self, id_prefix=construct_id, compute_environments=[compute_environment])
+
+            self.make_output("METAFLOW_BATCH_JOB_QUEUE", batch_job_queue.job_queue_arn, "set [METAFLOW_BATCH_JOB_QUEUE] as this value when running 'metaflow configure aws'")
 
         # Begin - metadata service and UI
 
@@ -161,14 +242,9 @@ class Metaflow(Construct):
         metadata_svc = MetadataService(
             self,
             "metaflow-metadata-service",
-            db_host=metadata_database.db_instance.db_instance_endpoint_address,
-            db_port=metadata_database.db_instance.db_instance_endpoint_port,
-            db_user=metadata_database.db_instance.secret.secret_value_from_json(
-                "username"
-            ).to_string(),
-            db_password_token=metadata_database.db_instance.secret.secret_value_from_json(
-                "password"
-            ).to_string(),
+            db_host=db_host,
+            db_port=db_port,
+            db_secret=db_secret,
             db_name="metaflow",
             db_security_group=metadata_database.db_security_group,
             ecs_cluster_in_vpc=ecs_cluster_in_vpc,
@@ -176,18 +252,15 @@ class Metaflow(Construct):
         )
 
         if enable_ui:
+            from cdk_metaflow.ui.ecs import UIBackendService, UIFrontendService
+
             ui_backend_svc = UIBackendService(
                 self,
                 "metaflow-ui-backend-service",
                 load_balancer_listener_port=MetaflowUIBackendServiceConstants.CONTAINER_PORT,
-                db_host=metadata_database.db_instance.db_instance_endpoint_address,
-                db_port=metadata_database.db_instance.db_instance_endpoint_port,
-                db_user=metadata_database.db_instance.secret.secret_value_from_json(
-                    "username"
-                ).to_string(),
-                db_password_token=metadata_database.db_instance.secret.secret_value_from_json(
-                    "password"
-                ).to_string(),
+                db_host=db_host,
+                db_port=db_port,
+                db_secret=db_secret,
                 db_name=metadata_database.database_name,
                 metaflow_artifacts_bucket_name=artifacts_bucket.bucket_name,
                 db_security_group=metadata_database.db_security_group,
@@ -209,18 +282,27 @@ class Metaflow(Construct):
 
         # self.make_output("MetadataServiceURL", metadata_svc.url)
         # self.make_output("MetadataAPIDocsUrl", metadata_svc.docs_url)
-        db_url = metadata_database.db_instance.db_instance_endpoint_address
-        self.make_output("DatabaseUrl", db_url)
+        self.make_output("DatabaseUrl", db_host)
         self.make_output("LoadBalancerUrl", alb.load_balancer_dns_name)
         self.make_output("MetadataAndUIEcsCluster", ecs_cluster_in_vpc.cluster_arn)
 
+        self._emit_outputs()
+
     def make_output(
         self,
         name: str,
         value: str,
         description: Optional[str] = None,
-    ) -> CfnOutput:
-        return CfnOutput(scope=self, id=name, description=description, value=value)
+    ) -> None:
+        """Register an output; the CfnOutput constructs are created by :meth:`_emit_outputs`."""
+        self._outputs[name] = (value, description)
+
+    def _emit_outputs(self) -> None:
+        # creating every CfnOutput in one pass keeps the per-construct overhead
+        # (stack-trace capture, Lazy registration) out of the main constructor body,
+        # and self._outputs lets tests assert on outputs without walking the tree
+        for name, (value, description) in self._outputs.items():
+            CfnOutput(scope=self, id=name, description=description, value=value)
 
 
 class MetadataDatabase(Construct):
@@ -230,53 +312,116 @@ class MetadataDatabase(Construct):
         id: str,
         vpc: ec2.Vpc,
         database_name: Optional[str] = "metaflow",
+        engine_mode: Literal["instance", "serverless_v2"] = "instance",
+        dev_mode: bool = False,
         **kwargs,
     ):
+        """Create the Postgres database backing the metadata service.
+
+        :param dev_mode: open port 5432 to the whole internet so you can poke at the
+            database from your laptop; leave False so only the ECS services (which
+            share the database's security group) can connect
+        :param engine_mode: ``"instance"`` (default) creates the t3.micro RDS instance;
+            ``"serverless_v2"`` creates an Aurora Serverless v2 cluster that scales down
+            to 0.5 ACU--it starts in seconds instead of the ~10 minutes a fresh instance
+            takes, which makes "tear it down, bring it back later" workflows practical.
+
+        Regardless of mode, consumers should use ``db_endpoint_address``,
+        ``db_endpoint_port``, and ``db_secret``.
+        """
         super().__init__(scope, id, **kwargs)
+        ec2 = lazy_import("aws_cdk.aws_ec2")
+        rds = lazy_import("aws_cdk.aws_rds")
         self.database_name = database_name
 
         self.db_security_group = ec2.SecurityGroup(
             self, "db-security-group", allow_all_outbound=True, vpc=vpc
         )
 
-        # TODO: have a "dev mode" that conditionally enables this parameter. In general, the DB
-        # should not be accessible to the public.
+        # the ECS services run with this same security group attached, so a
+        # self-referencing rule is all legitimate postgres traffic needs; besides the
+        # security smell, an open rule means internet scan traffic hits the DB ENI
         self.db_security_group.add_ingress_rule(
-            peer=ec2.Peer.ipv4("0.0.0.0/0"), connection=ec2.Port.tcp(5432)
+            peer=self.db_security_group, connection=_pg_port()
         )
+        if dev_mode:
+            self.db_security_group.add_ingress_rule(
+                peer=_any_ipv4(), connection=_pg_port()
+            )
 
-        self.db_instance = rds.DatabaseInstance(
-            self,
-            "metadata-db",
-            removal_policy=cdk.RemovalPolicy.DESTROY,
-            engine=rds.DatabaseInstanceEngine.postgres(
-                version=rds.PostgresEngineVersion.VER_14
+        if engine_mode == "serverless_v2":
+            self.db_instance = None
+            self.db_cluster = rds.DatabaseCluster(
+                self,
+                "metadata-db",
+                removal_policy=cdk.RemovalPolicy.DESTROY,
+                engine=rds.DatabaseClusterEngine.aurora_postgres(
+                    version=rds.AuroraPostgresEngineVersion.VER_14_6
+                ),
+                writer=rds.ClusterInstance.serverless_v2("writer"),
+                serverless_v2_min_capacity=0.5,
+                serverless_v2_max_capacity=2,
+                default_database_name=database_name,
+                # secret in AWS SecretsManager of the form {"username": "master", "password": "xxxx", "port": xxxx}
+                credentials=rds.Credentials.from_username(username="master"),
+                security_groups=[self.db_security_group],
+                vpc=vpc,
+                vpc_subnets=_public_subnets(),
+            )
+            self.db_secret = self.db_cluster.secret
+            self.db_endpoint_address = self.db_cluster.cluster_endpoint.hostname
+            self.db_endpoint_port = cdk.Token.as_string(self.db_cluster.cluster_endpoint.port)
+        else:
+            self.db_cluster = None
+            self.db_instance = rds.DatabaseInstance(
+                self,
+                "metadata-db",
+                removal_policy=cdk.RemovalPolicy.DESTROY,
+                engine=rds.DatabaseInstanceEngine.postgres(
+                    version=rds.PostgresEngineVersion.VER_14
+                ),
+                instance_type=ec2.InstanceType("t3.micro"),  # ~$7/mo
+                database_name=database_name,
+                storage_type=rds.StorageType.GP2,
+                # secret in AWS SecretsManager of the form {"username": "master", "password": "xxxx", "port": xxxx}
+                credentials=rds.Credentials.from_username(username="master"),
+                multi_az=False,
+                security_groups=[self.db_security_group],
+                vpc=vpc,
+                # TODO: consider NOT putting the database in a public subnet 🤣
+                vpc_subnets=_public_subnets(),
+            )
+            self.db_secret = self.db_instance.secret
+            self.db_endpoint_address = self.db_instance.db_instance_endpoint_address
+            self.db_endpoint_port = self.db_instance.db_instance_endpoint_port
+
+
+def make_low_cost_vpc(
+    scope: Construct, cidr: str, nat_gateways: int = 1, use_fck_nat: bool = True
+) -> ec2.Vpc:
+    ec2 = lazy_import("aws_cdk.aws_ec2")
+    if use_fck_nat:
+        # the community fck-nat AMI on a Graviton t4g.nano: cheaper than t2.nano and
+        # several times the throughput, so ECR image pulls on task cold start aren't
+        # bottlenecked by the NAT instance. https://fck-nat.dev/
+        nat_provider = ec2.NatProvider.instance(
+            instance_type=ec2.InstanceType("t4g.nano"),
+            machine_image=ec2.LookupMachineImage(
+                name="fck-nat-al2023-*-arm64-ebs", owners=["568608671756"]
             ),
-            instance_type=ec2.InstanceType("t3.micro"),  # ~$7/mo
-            database_name=database_name,
-            storage_type=rds.StorageType.GP2,
-            # secret in AWS SecretsManager of the form {"username": "master", "password": "xxxx", "port": xxxx}
-            credentials=rds.Credentials.from_username(username="master"),
-            multi_az=False,
-            security_groups=[self.db_security_group],
-            vpc=vpc,
-            # TODO: consider NOT putting the database in a public subnet 🤣
-            vpc_subnets=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PUBLIC),
         )
-
-
-def make_low_cost_vpc(scope: Construct, cidr: str) -> ec2.Vpc:
-    return ec2.Vpc(
+    else:
+        # stock Amazon Linux NAT AMI; saturates around ~20Mbit but needs no AMI lookup
+        nat_provider = ec2.NatProvider.instance(instance_type=ec2.InstanceType("t2.nano"))
+    vpc = ec2.Vpc(
         scope=scope,
         id="vpc",
         enable_dns_support=True,
         enable_dns_hostnames=True,
         cidr=cidr,
         max_azs=2,
-        nat_gateways=1,
-        nat_gateway_provider=ec2.NatProvider.instance(
-            instance_type=ec2.InstanceType("t2.nano")
-        ),
+        nat_gateways=nat_gateways,
+        nat_gateway_provider=nat_provider,
         subnet_configuration=[
             ec2.SubnetConfiguration(
                 map_public_ip_on_launch=True,
@@ -292,23 +437,295 @@ def make_low_cost_vpc(scope: Construct, cidr: str) -> ec2.Vpc:
         ],
     )
 
+    # Metaflow traffic is almost entirely S3/DynamoDB/ECR/logs/Secrets Manager; VPC
+    # endpoints let that traffic skip the nano NAT instance entirely,
+    # which makes ECS image pulls and artifact reads noticeably faster and free of
+    # per-GB NAT cost. With all endpoints in place, pure-AWS workloads can even run
+    # with nat_gateways=0.
+    vpc.add_gateway_endpoint("s3-endpoint", service=ec2.GatewayVpcEndpointAwsService.S3)
+    vpc.add_gateway_endpoint("dynamodb-endpoint", service=ec2.GatewayVpcEndpointAwsService.DYNAMODB)
+    for endpoint_name in ("ECR", "ECR_DOCKER", "CLOUDWATCH_LOGS", "SECRETS_MANAGER", "STS"):
+        vpc.add_interface_endpoint(
+            endpoint_name.lower().replace("_", "-") + "-endpoint",
+            service=getattr(ec2.InterfaceVpcEndpointAwsService, endpoint_name),
+        )
+
+    return vpc
+
 
 def lookup_or_create_artifacts_bucket(
-    scope: Construct, id_prefix: str, artifacts_bucket_name: Optional[str] = None
+    scope: Construct,
+    id_prefix: str,
+    artifacts_bucket_name: Optional[str] = None,
+    retain_artifacts: bool = False,
+    artifact_retention_days: Optional[int] = None,
 ) -> s3.Bucket:
+    """
+    Look up an existing artifacts bucket by name, or create one.
+
+    ``auto_delete_objects=True`` would be convenient, but it inserts a Lambda-backed
+    custom resource (plus its IAM role, log group, and asset upload) into the template
+    just to empty the bucket on deletion. Instead we rely on lifecycle rules; note that
+    a non-empty bucket blocks ``cdk destroy`` until it is emptied manually.
+
+    :param retain_artifacts: keep the bucket (and your precious model weights) on stack
+        deletion; leave False for throwaway development deployments
+    :param artifact_retention_days: if set, expire artifacts after this many days
+    """
+    s3 = lazy_import("aws_cdk.aws_s3")
     construct_id = f"{id_prefix}-artifacts-bucket"
     artifacts_bucket: Optional[
         s3.Bucket
     ] = artifacts_bucket_name and s3.Bucket.from_bucket_name(
         scope, construct_id, bucket_name=artifacts_bucket_name
     )
+    lifecycle_rules = [
+        # incomplete multipart uploads are invisible in the console but billed; drop them
+        s3.LifecycleRule(abort_incomplete_multipart_upload_after=cdk.Duration.days(1)),
+    ]
+    if artifact_retention_days is not None:
+        lifecycle_rules.append(
+            s3.LifecycleRule(expiration=cdk.Duration.days(artifact_retention_days))
+        )
     artifacts_bucket: s3.Bucket = artifacts_bucket or s3.Bucket(
         scope,
         construct_id,
-        auto_delete_objects=True,
-        # TODO: you miiiiight want to keep your bucket around on deletion to save
-        # all your precious model weights and other artifacts. This is set to destroy for convenience
-        # during development. Retain would probably be better.
-        removal_policy=cdk.RemovalPolicy.DESTROY,
+        lifecycle_rules=lifecycle_rules,
+        removal_policy=cdk.RemovalPolicy.RETAIN
+        if retain_artifacts
+        else cdk.RemovalPolicy.DESTROY,
     )
     return artifacts_bucket
+
+
+# Begin - split stacks
+#
+# The `Metaflow` construct above deploys everything as one stack, which means every
+# `cdk deploy` touches the whole deployment even when you are iterating on a single
+# piece. The stacks below expose the same resources as independently deployable
+# units so that e.g. `cdk deploy metaflow-metadata` leaves the UI branch untouched
+# (the app still constructs every stack; the savings are in asset staging and
+# deployment, not Python construction). Cross-stack values (VPC, bucket, database)
+# are passed as construct references and wired up by CDK's automatic cross-stack
+# exports.
+
+
+class MetaflowNetworkStack(Stack):
+    """The VPC (plus NAT instance) that every other Metaflow stack deploys into."""
+
+    def __init__(
+        self, scope: Construct, construct_id: str, vpc_cidr: str, **kwargs
+    ) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+        self.vpc: ec2.Vpc = make_low_cost_vpc(scope=self, cidr=vpc_cidr)
+
+
+class MetaflowDataStack(Stack):
+    """Durable state: the artifacts bucket, flow-run state DynamoDB table, and metadata database."""
+
+    def __init__(
+        self,
+        scope: Construct,
+        construct_id: str,
+        vpc: ec2.Vpc,
+        artifacts_bucket_name: Optional[str] = None,
+        db_engine_mode: Literal["instance", "serverless_v2"] = "instance",
+        **kwargs,
+    ) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+        self.artifacts_bucket: s3.Bucket = lookup_or_create_artifacts_bucket(
+            self, construct_id, artifacts_bucket_name=artifacts_bucket_name
+        )
+        self.sfn_state_ddb_table: dynamodb.Table = make_step_function_state_ddb_table(
+            scope=self, id_prefix=construct_id
+        )
+        self.metadata_database = MetadataDatabase(
+            self, id="metaflow-metadata-db", vpc=vpc, database_name="metaflow", engine_mode=db_engine_mode
+        )
+
+
+class MetaflowMetadataStack(Stack):
+    """Batch compute, the client IAM role, and the metadata service behind its own ALB."""
+
+    def __init__(
+        self,
+        scope: Construct,
+        construct_id: str,
+        vpc: ec2.Vpc,
+        artifacts_bucket: s3.Bucket,
+        sfn_state_ddb_table: dynamodb.Table,
+        metadata_database: "MetadataDatabase",
+        enable_sagemaker: Optional[bool] = False,
+        **kwargs,
+    ) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+        ecs = lazy_import("aws_cdk.aws_ecs")
+        elbv2 = lazy_import("aws_cdk.aws_elasticloadbalancingv2")
+        from cdk_metaflow.computation.batch import (
+            make_batch_job_queue,
+            make_fargate_compute_environment,
+        )
+
+        ecs_s3_access_iam_role = make_ecs_s3_access_iam_role(
+            allow_sagemaker=enable_sagemaker,
+            artifacts_bucket_name=artifacts_bucket.bucket_name,
+            scope=self,
+            id_prefix=construct_id,
+            flow_run_state_ddb_table_name=sfn_state_ddb_table.table_name,
+        )
+        compute_environment: batch.ComputeEnvironment = make_fargate_compute_environment(
+            scope=self, id_prefix=construct_id, vpc_with_metadata_service=vpc
+        )
+        batch_job_queue: batch.JobQueue = make_batch_job_queue(
+            scope=self, id_prefix=construct_id, compute_environments=[compute_environment]
+        )
+
+        self.alb = elbv2.ApplicationLoadBalancer(
+            self, "application-load-balancer", vpc=vpc, internet_facing=True
+        )
+        self.ecs_cluster = ecs.Cluster(self, "metaflow-cluster", vpc=vpc)
+
+        db_secret = metadata_database.db_secret
+        MetadataService(
+            self,
+            "metaflow-metadata-service",
+            db_host=metadata_database.db_endpoint_address,
+            db_port=metadata_database.db_endpoint_port,
+            db_secret=db_secret,
+            db_name=metadata_database.database_name,
+            db_security_group=metadata_database.db_security_group,
+            ecs_cluster_in_vpc=self.ecs_cluster,
+            alb=self.alb,
+        )
+
+        CfnOutput(
+            self,
+            "METAFLOW_ECS_S3_ACCESS_IAM_ROLE",
+            value=ecs_s3_access_iam_role.role_arn,
+            description="set [METAFLOW_ECS_S3_ACCESS_IAM_ROLE] as this value when running 'metaflow configure aws'",
+        )
+        CfnOutput(
+            self,
+            "METAFLOW_BATCH_JOB_QUEUE",
+            value=batch_job_queue.job_queue_arn,
+            description="set [METAFLOW_BATCH_JOB_QUEUE] as this value when running 'metaflow configure aws'",
+        )
+
+
+class MetaflowUiStack(Stack):
+    """The Metaflow UI backend and frontend services, attached to the metadata stack's ALB."""
+
+    def __init__(
+        self,
+        scope: Construct,
+        construct_id: str,
+        metadata_database: "MetadataDatabase",
+        artifacts_bucket: s3.Bucket,
+        ecs_cluster: ecs.Cluster,
+        alb: elbv2.ApplicationLoadBalancer,
+        **kwargs,
+    ) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+        from cdk_metaflow.ui.ecs import UIBackendService, UIFrontendService
+
+        db_secret = metadata_database.db_secret
+        ui_backend_svc = UIBackendService(
+            self,
+            "metaflow-ui-backend-service",
+            load_balancer_listener_port=MetaflowUIBackendServiceConstants.CONTAINER_PORT,
+            db_host=metadata_database.db_endpoint_address,
+            db_port=metadata_database.db_endpoint_port,
+            db_secret=db_secret,
+            db_name=metadata_database.database_name,
+            metaflow_artifacts_bucket_name=artifacts_bucket.bucket_name,
+            db_security_group=metadata_database.db_security_group,
+            ecs_cluster_in_vpc=ecs_cluster,
+            alb=alb,
+        )
+        UIFrontendService(
+            self,
+            "metaflow-ui-frontend-service",
+            ecs_cluster_in_vpc=ecs_cluster,
+            backend_url=ui_backend_svc.url,
+            alb=alb,
+        )
+
+        CfnOutput(self, "UIBackendURL", value=ui_backend_svc.url)
+
+
+def make_metaflow_stacks(
+    scope: Construct,
+    id_prefix: str,
+    config: MetaflowStackConfig,
+    env=None,
+    enable_ui: Optional[bool] = True,
+    enable_sagemaker: Optional[bool] = True,
+) -> list[Stack]:
+    """
+    Create the Metaflow deployment as independent stacks, e.g. ``<prefix>-network``.
+
+    Deploy (or diff) any one of them with ``cdk deploy <prefix>-metadata`` without
+    touching the others. All four stacks are still constructed on every run (they
+    share object references); the per-stack savings are in asset staging,
+    diffing, and deployment rather than Python construction.
+    """
+    network = MetaflowNetworkStack(scope, f"{id_prefix}-network", vpc_cidr=config.vpc_cidr, env=env)
+    data = MetaflowDataStack(
+        scope, f"{id_prefix}-data", vpc=network.vpc, db_engine_mode=config.db_engine_mode, env=env
+    )
+    metadata = MetaflowMetadataStack(
+        scope,
+        f"{id_prefix}-metadata",
+        vpc=network.vpc,
+        artifacts_bucket=data.artifacts_bucket,
+        sfn_state_ddb_table=data.sfn_state_ddb_table,
+        metadata_database=data.metadata_database,
+        enable_sagemaker=enable_sagemaker,
+        env=env,
+    )
+    stacks = [network, data, metadata]
+    if enable_ui:
+        stacks.append(
+            MetaflowUiStack(
+                scope,
+                f"{id_prefix}-ui",
+                metadata_database=data.metadata_database,
+                artifacts_bucket=data.artifacts_bucket,
+                ecs_cluster=metadata.ecs_cluster,
+                alb=metadata.alb,
+                env=env,
+            )
+        )
+    return stacks
+
+
+class MetaflowStage(cdk.Stage):
+    """
+    The whole Metaflow deployment (network/data/metadata/ui stacks) as a ``cdk.Stage``.
+
+    A Stage gets its own cloud assembly, so the CDK CLI can target one child stack
+    (``cdk synth --exclusively metaflow/<prefix>-metadata``) and skip staging,
+    diffing, and deploying the siblings--handy for the interactive ``cdk diff``
+    loop while iterating on a single service. Note the app itself still constructs
+    all the stacks each run; ``--exclusively`` saves CLI-side work, not Python
+    construction time.
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        construct_id: str,
+        config: MetaflowStackConfig,
+        env=None,
+        enable_ui: Optional[bool] = True,
+        enable_sagemaker: Optional[bool] = True,
+        **kwargs,
+    ) -> None:
+        super().__init__(scope, construct_id, env=env, **kwargs)
+        self.stacks = make_metaflow_stacks(
+            self,
+            id_prefix=construct_id,
+            config=config,
+            enable_ui=enable_ui,
+            enable_sagemaker=enable_sagemaker,
+        )
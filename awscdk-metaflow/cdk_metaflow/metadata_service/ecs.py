@@ -1,13 +1,7 @@
-from typing import Optional
-import aws_cdk as cdk
-from aws_cdk import Stack, CfnOutput
-from cdk_metaflow.config import MetaflowStackConfig
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
 from constructs import Construct
-from aws_cdk import aws_ecs_patterns as ecs_patterns
-from aws_cdk import aws_ecs as ecs
-from aws_cdk import aws_rds as rds
-from aws_cdk import aws_s3 as s3
-from aws_cdk import aws_elasticloadbalancingv2 as elbv2
 
 from cdk_metaflow.config import (
     MetaflowMetadataServiceConstants,
@@ -16,9 +10,14 @@ from cdk_metaflow.config import (
 )
 
 from cdk_metaflow.webservice import Webservice, PortMapping
-from cdk_metaflow.utils import make_namer_fn, TNamerFn
+from cdk_metaflow.utils import lazy_import, make_namer_fn, TNamerFn
+
+if TYPE_CHECKING:
+    from aws_cdk import aws_ec2 as ec2
+    from aws_cdk import aws_ecs as ecs
+    from aws_cdk import aws_elasticloadbalancingv2 as elbv2
+    from aws_cdk import aws_secretsmanager as secretsmanager
 
-from aws_cdk import aws_ec2 as ec2
 
 class MetadataService(Construct):
     """
@@ -62,8 +61,7 @@ class MetadataService(Construct):
         construct_id: str,
         db_host: str,
         db_port: str,
-        db_user: str,
-        db_password_token: str,
+        db_secret: secretsmanager.ISecret,
         db_name: str,
         db_security_group: ec2.SecurityGroup,
         ecs_cluster_in_vpc: ecs.Cluster,
@@ -82,8 +80,8 @@ class MetadataService(Construct):
         :param construct_id: construct id
         :param db_host: host of the relational database
         :param db_port: port of the relational database
-        :param db_user: user in the relational database
-        :param db_password_token: either a plaintext password (bad idea); or reference that resolves
+        :param db_secret: SecretsManager secret holding the database ``username``/``password`` keys;
+            the ECS agent injects them at task start, so they never appear in the task definition
         :param db_name: name of the database within the database instance where the metadata is stored
         :param db_security_group: security group that provides access to the database on the needed port
         :param ecs_cluster_in_vpc: the cluster where this service will be deployed to; it should be configured with a VPC
@@ -94,6 +92,7 @@ class MetadataService(Construct):
         :param desired_container_count: how many instances to default to after high traffic spikes settle down. TODO: should we expose the min count and max count?
         """
         super().__init__(scope, construct_id, **kwargs)
+        ecs = lazy_import("aws_cdk.aws_ecs")
         self.namer: TNamerFn = make_namer_fn(construct_id)
 
         Webservice(
@@ -113,10 +112,12 @@ class MetadataService(Construct):
             container_env_vars_overrides={
                 "MF_METADATA_DB_HOST": db_host,
                 "MF_METADATA_DB_PORT": db_port,
-                "MF_METADATA_DB_USER": db_user,
-                "MF_METADATA_DB_PSWD": db_password_token,
                 "MF_METADATA_DB_NAME": db_name,
             },
+            container_secrets={
+                "MF_METADATA_DB_USER": ecs.Secret.from_secrets_manager(db_secret, "username"),
+                "MF_METADATA_DB_PSWD": ecs.Secret.from_secrets_manager(db_secret, "password"),
+            },
             ecs_cluster_in_vpc=ecs_cluster_in_vpc,
             ecs_memory_limit_mb=max_container_memory_mb,
             ecs_cpu_size=max_container_cpu_mb,
@@ -127,45 +128,5 @@ class MetadataService(Construct):
             service_security_groups=[db_security_group],
         )
 
-
-        # svc = ecs_patterns.ApplicationLoadBalancedFargateService(
-        #     self,
-        #     "metaflow-metadata-service-v2",
-        #     cluster=ecs_cluster_in_vpc,
-        #     task_subnets=ec2.SubnetSelection(
-        #         subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS
-        #     ),
-        #     security_groups=[db_security_group],
-        #     assign_public_ip=True,
-        #     load_balancer=alb,
-        #     circuit_breaker=ecs.DeploymentCircuitBreaker(rollback=True),
-        #     listener_port=80,
-        #     # certificate=tls_cert,
-        #     # protocol=elbv2.ApplicationProtocol.HTTPS,
-        #     desired_count=desired_container_count,
-        #     cpu=max_container_cpu_mb,
-        #     memory_limit_mib=max_container_memory_mb,
-        #     task_image_options=ecs_patterns.ApplicationLoadBalancedTaskImageOptions(
-        #         image=ecs.ContainerImage.from_registry(
-        #             MetaflowMetadataServiceConstants.IMAGE_URL
-        #         ),
-        #         container_port=container_port,
-        #         environment={
-        #             "MF_METADATA_DB_HOST": db_host,
-        #             "MF_METADATA_DB_PORT": db_port,
-        #             "MF_METADATA_DB_USER": db_user,
-        #             "MF_METADATA_DB_PSWD": db_password_token,
-        #             "MF_METADATA_DB_NAME": db_name,
-        #         },
-        #         log_driver=ecs.LogDriver.aws_logs(stream_prefix="metadata-service"),
-        #     ),
-        # )
-
-        # healthcheck ECS will use to determine whether to terminate/restart the container
-        # svc.target_group.configure_health_check(
-        #     port=str(container_port),
-        #     path=MetaflowMetadataServiceConstants.HEALTHCHECK_PATH,
-        # )
-
         self.url = f"http://{alb.load_balancer_dns_name}"
         self.docs_url = f"{self.url}/api/doc"
\ No newline at end of file
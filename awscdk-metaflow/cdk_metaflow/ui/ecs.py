@@ -8,6 +8,7 @@ from aws_cdk import aws_ecs as ecs
 from aws_cdk import aws_ec2 as ec2
 from aws_cdk import aws_rds as rds
 from aws_cdk import aws_s3 as s3
+from aws_cdk import aws_secretsmanager as secretsmanager
 from aws_cdk import aws_elasticloadbalancingv2 as elbv2
 
 from cdk_metaflow.webservice import Webservice, PortMapping
@@ -18,6 +19,19 @@ from cdk_metaflow.config import (
     MetaflowUIFrontendServiceConstants,
 )
 
+# env vars that are the same for every UIBackendService instance; copied (not
+# mutated) in __init__ so multi-stack apps build this dict once
+_STATIC_BACKEND_ENV = {
+    "UI_ENABLED": "1",
+    "LOGLEVEL": "DEBUG",
+    # NOTE: I wonder if there is a "local" mode or something else we could use
+    # to run a fully working version of metaflow using docker-compose or docker swarm.
+    # Local dev environments are underrated!
+    "METAFLOW_DEFAULT_DATASTORE": "s3",
+    "METAFLOW_DEFAULT_METADATA": "service",
+}
+
+
 class UIBackendService(Construct):
 
     def __init__(
@@ -26,8 +40,7 @@ class UIBackendService(Construct):
         construct_id: str,
         db_host: str,
         db_port: str,
-        db_user: str,
-        db_password_token: str,
+        db_secret: secretsmanager.ISecret,
         db_name: str,
         db_security_group: ec2.SecurityGroup,
         metaflow_artifacts_bucket_name: str,
@@ -42,10 +55,28 @@ class UIBackendService(Construct):
         health_check_path: Optional[str] = MetaflowUIBackendServiceConstants.HEALTHCHECK_PATH,
         min_tasks: Optional[int] = 1,
         max_tasks: Optional[int] = 1,
+        **kwargs,
     ) -> None:
-        super().__init__(scope, construct_id)
+        super().__init__(scope, construct_id, **kwargs)
         self.namer = make_namer_fn(construct_id)
 
+        # NOTE: We could use minIO here if we really wanted to save money and run
+        # this all on-prem.
+        datastore_root = f"s3://{metaflow_artifacts_bucket_name}/metaflow"
+        container_env_vars = _STATIC_BACKEND_ENV.copy()
+        container_env_vars.update(
+            {
+                "MF_METADATA_DB_HOST": db_host,
+                "MF_METADATA_DB_PORT": db_port,
+                "MF_METADATA_DB_NAME": db_name,
+                "PATH_PREFIX": url_path_prefix,
+                "MF_DATASTORE_ROOT": datastore_root,
+                "METAFLOW_DATASTORE_SYSROOT_S3": datastore_root,
+                # NOTE: the metaflow UI webserver is its own backend server; accessed e.g. localhost:8082/api/metadata
+                "METAFLOW_SERVICE_URL": f"http://localhost:{container_port}{url_path_prefix}metadata",
+            }
+        )
+
         Webservice(
             self,
             construct_id=self.namer("Webservice"),
@@ -65,26 +96,10 @@ class UIBackendService(Construct):
                 "services.ui_backend_service.ui_server",
             ],
             health_check_path=health_check_path,
-            container_env_vars_overrides={
-                "MF_METADATA_DB_HOST": db_host,
-                "MF_METADATA_DB_PORT": db_port,
-                "MF_METADATA_DB_USER": db_user,
-                "MF_METADATA_DB_PSWD": db_password_token,
-                "MF_METADATA_DB_NAME": db_name,
-                "UI_ENABLED": "1",
-                "PATH_PREFIX": url_path_prefix,
-                # NOTE: We could use minIO here if we really wanted to save money and run
-                # this all on-prem.
-                "MF_DATASTORE_ROOT": f"s3://{metaflow_artifacts_bucket_name}/metaflow",
-                "METAFLOW_DATASTORE_SYSROOT_S3": f"s3://{metaflow_artifacts_bucket_name}/metaflow",
-                "LOGLEVEL": "DEBUG",
-                # NOTE: the metaflow UI webserver is its own backend server; accessed e.g. localhost:8082/api/metadata
-                "METAFLOW_SERVICE_URL": f"http://localhost:{container_port}{url_path_prefix}metadata",
-                # NOTE: I wonder if there is a "local" mode or something else we could use
-                # to run a fully working version of metaflow using docker-compose or docker swarm.
-                # Local dev environments are underrated!
-                "METAFLOW_DEFAULT_DATASTORE": "s3",
-                "METAFLOW_DEFAULT_METADATA": "service",
+            container_env_vars_overrides=container_env_vars,
+            container_secrets={
+                "MF_METADATA_DB_USER": ecs.Secret.from_secrets_manager(db_secret, "username"),
+                "MF_METADATA_DB_PSWD": ecs.Secret.from_secrets_manager(db_secret, "password"),
             },
             ecs_cluster_in_vpc=ecs_cluster_in_vpc,
             ecs_memory_limit_mb=max_container_memory_mb,
@@ -1,7 +1,53 @@
-from typing import Callable
+import importlib
+from functools import lru_cache
+from types import ModuleType
+from typing import Callable, Dict
 
 TNamerFn = Callable[[str], str]
 
+_lazy_module_cache: Dict[str, ModuleType] = {}
+
+
+def lazy_import(module_name: str) -> ModuleType:
+    """
+    Import ``module_name`` on first use and cache the module object.
+
+    ``aws_cdk`` submodules are expensive to import--each one registers its full
+    jsii type assembly with the Node runtime--so constructs call this at the top
+    of the code paths that actually need a submodule rather than importing
+    everything at module load. Repeated calls return the cached module.
+    """
+    module = _lazy_module_cache.get(module_name)
+    if module is None:
+        module = _lazy_module_cache[module_name] = importlib.import_module(module_name)
+    return module
+
+class _Namer:
+    """
+    Callable that prefixes construct IDs, memoizing each formatted string.
+
+    Construct subtrees call their namer with the same handful of suffixes
+    (``"Webservice"``, ``"UIService"``, ...) over and over during synth; caching
+    the formatted result means each ``(prefix, suffix)`` pair is built once.
+    """
+
+    __slots__ = ("_prefix", "_cache")
+
+    def __init__(self, prefix: str) -> None:
+        self._prefix = prefix
+        self._cache: Dict[str, str] = {}
+
+    def __call__(self, s: str) -> str:
+        return self._cache.setdefault(s, f"{self._prefix}-{s}")
+
+
+@lru_cache(maxsize=None)
 def make_namer_fn(prefix) -> TNamerFn:
-    """Return a naming function that can be used to concisely ensure that construct IDs are unique."""
-    return lambda s: f"{prefix}-{s}"
\ No newline at end of file
+    """
+    Return a naming function that can be used to concisely ensure that construct IDs are unique.
+
+    Namers are pure (they only capture ``prefix``), so results are memoized twice
+    over: sibling factories called with the same ``prefix`` share a single
+    :class:`_Namer`, and the namer itself caches every string it formats.
+    """
+    return _Namer(prefix)
\ No newline at end of file
@@ -4,7 +4,8 @@ Generic OAuth utilities that can be used with any OAuth-complient provider.
 Example providers: self-hosted, Auth0, Okta, Cognito, etc.
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from constructs import Construct
 from aws_cdk import aws_elasticloadbalancingv2 as elbv2
@@ -15,6 +16,29 @@ from aws_cdk import aws_certificatemanager as acm
 import aws_cdk as cdk
 
 
+@lru_cache(maxsize=64)
+def _oidc_endpoint_config(issuer_url: str, scopes: Tuple[str, ...]) -> Dict[str, str]:
+    """
+    Derive the OIDC endpoint URLs and scope string for an issuer, once per tenant.
+
+    The same Auth0 tenant typically protects several URL patterns; the derived
+    strings are identical across those calls, so they are cached by
+    ``(issuer_url, scopes)`` rather than rebuilt per listener rule.
+    """
+    scope = " ".join(s.strip() for s in scopes)
+
+    # TODO: is forcing a slash at the end of this a bad idea? I think we always need a slash but I could be wrong.
+    issuer_url = issuer_url.strip("/") + "/"
+
+    return {
+        "issuer": issuer_url,
+        "token_endpoint": f"{issuer_url}/oauth/token",
+        "user_info_endpoint": f"{issuer_url}/userinfo",
+        "authorization_endpoint": f"{issuer_url}/authorize",
+        "scope": scope,
+    }
+
+
 def create_authenticate_oidc_listener_action(
     issuer_url: str,
     client_id: str,
@@ -43,22 +67,15 @@ def create_authenticate_oidc_listener_action(
     """
 
     scopes = scopes or ["openid", "profile"]
-    scope = " ".join(scope.strip() for scope in scopes)
-
-    # TODO: is forcing a slash at the end of this a bad idea? I think we always need a slash but I could be wrong.
-    issuer_url = issuer_url.strip("/") + "/"
+    endpoint_config = _oidc_endpoint_config(issuer_url, tuple(scopes))
 
     return elbv2.ListenerAction.authenticate_oidc(
-        issuer=issuer_url,
-        token_endpoint=f"{issuer_url}/oauth/token",
-        user_info_endpoint=f"{issuer_url}/userinfo",
-        authorization_endpoint=f"{issuer_url}/authorize",
         client_id=client_id,
         client_secret=client_secret,
-        scope=scope,
         next=next_action,
         session_cookie_name="AWSELBAuthSessionCookie",
         session_timeout=session_timeout or cdk.Duration.days(1),
+        **endpoint_config,
     )
 
 
@@ -10,9 +10,9 @@ permissions, and other associations.
 from __future__ import annotations
 
 import datetime
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Dict, Optional, Union, List
-from collections import Counter
+from typing import NamedTuple
 
 import aws_cdk as cdk
 import aws_cdk.aws_secretsmanager as secretsmanager
@@ -33,40 +33,55 @@ from dataclasses import dataclass, field
 LOG_RETENTION: RetentionDays = RetentionDays.THREE_DAYS
 
 
-@dataclass
+class _UnpackedPortMappings(NamedTuple):
+    """Parallel lists of the fields of several ``PortMapping``s, extracted in one pass."""
+
+    listener_ports: list[int]
+    container_ports: list[int]
+    path_patterns: list[str | None]
+
+
+# slots drops the per-instance __dict__; frozen makes mappings hashable value objects
+@dataclass(slots=True, frozen=True)
 class PortMapping:
     """Class used to represent port mappings from the load balancer to the container."""
 
     listener_port: int
     container_port: int
-    path_pattern: Optional[str] = field(default="*")
+    path_pattern: str | None = field(default="*")
 
     @staticmethod
-    def do_port_mappings_conflict(port_mappings: List["PortMapping"]) -> bool:
+    def do_port_mappings_conflict(port_mappings: list["PortMapping"]) -> bool:
         """
         Return true if any of the port mappings conflict.
         
         The each listener port should appear only once.
         """
-        listener_ports = [port_mapping.listener_port for port_mapping in port_mappings]
-        listener_port_counts = Counter(listener_ports)
-        for _, num_listener_port_occurences in listener_port_counts.items():
-            if num_listener_port_occurences > 1:
+        seen_listener_ports = set()
+        for port_mapping in port_mappings:
+            if port_mapping.listener_port in seen_listener_ports:
                 return True
+            seen_listener_ports.add(port_mapping.listener_port)
         return False
 
     @staticmethod
-    def map_listener_port_to_mapping(port_mappings: List[PortMapping]) -> Dict[int, PortMapping]:
-        return {
-            port_mapping.listener_port: port_mapping for port_mapping in port_mappings
-        }
+    def unpack(port_mappings: list[PortMapping]) -> _UnpackedPortMappings:
+        """Split ``port_mappings`` into parallel field lists with a single walk of the list."""
+        listener_ports: list[int] = []
+        container_ports: list[int] = []
+        path_patterns: list[str | None] = []
+        for port_mapping in port_mappings:
+            listener_ports.append(port_mapping.listener_port)
+            container_ports.append(port_mapping.container_port)
+            path_patterns.append(port_mapping.path_pattern)
+        return _UnpackedPortMappings(listener_ports, container_ports, path_patterns)
 
     @staticmethod
-    def list_listener_ports(port_mappings: List[PortMapping]) -> List[int]:
+    def list_listener_ports(port_mappings: list[PortMapping]) -> list[int]:
         return [port_mapping.listener_port for port_mapping in port_mappings]
 
     @staticmethod
-    def list_container_ports(port_mappings: List[PortMapping]) -> List[int]:
+    def list_container_ports(port_mappings: list[PortMapping]) -> list[int]:
         return [port_mapping.container_port for port_mapping in port_mappings]
 
 
@@ -163,49 +178,56 @@ class Webservice(Construct):
     :param vpc_id: ID of an existing VPC, if not provided, a VPC will be created
     :param docker_build_args: mapping of environment variables passed as build arguments to ``docker build`` when building the docker image
     :param container_env_vars_overrides: environment variables which can override defaults or add new variables used during the container runtime
+    :param container_secrets: sensitive environment variables as ``ecs.Secret``s; these are fetched
+        by the ECS agent at task start rather than being baked into the task definition in plaintext
     """
 
     def __init__(
         self,
         scope: Construct,
         construct_id: str,
-        load_balancer_to_container_port_mappings: List[PortMapping],
+        load_balancer_to_container_port_mappings: list[PortMapping],
         health_check_path: str,
         ecs_memory_limit_mb: int = 512,
         ecs_cpu_size: int = 256,
         ecs_desired_num_instances: int = 1,
         min_tasks: int = 1,
         max_tasks: int = 1,
-        health_check_port: Optional[int] = None,
+        health_check_port: int | None = None,
         reachable_outside_vpc: bool = False,
-        scale_in_cooldown_seconds: Optional[int] = None,
-        scale_out_cooldown_seconds: Optional[int] = None,
+        scale_in_cooldown_seconds: int | None = None,
+        scale_out_cooldown_seconds: int | None = None,
         target_memory_utilization_percent: int = 50,
         target_cpu_utilization_percent: int = 50,
-        docker_container_command: Optional[List[str]] = None,
-        relative_dockerfile_path: Optional[Union[str, Path]] = None,
-        vpc_id: Optional[str] = None,
-        docker_build_context: Optional[Union[str, Path]] = None,
-        docker_build_args: Optional[Dict[str, str]] = None,
-        container_env_vars_overrides: Optional[Dict[str, str]] = None,
-        docker_image: Optional[ecs.ContainerImage] = None,
-        service_security_groups: Optional[List[ec2.SecurityGroup]] = None,
-        load_balancer: Optional[elbv2.ApplicationLoadBalancer] = None,
-        ecs_cluster_in_vpc: Optional[ecs.Cluster] = None,
+        docker_container_command: list[str] | None = None,
+        relative_dockerfile_path: str | Path | None = None,
+        vpc_id: str | None = None,
+        docker_build_context: str | Path | None = None,
+        docker_build_args: dict[str, str] | None = None,
+        container_env_vars_overrides: dict[str, str] | None = None,
+        container_secrets: dict[str, ecs.Secret] | None = None,
+        docker_image: ecs.ContainerImage | None = None,
+        service_security_groups: list[ec2.SecurityGroup] | None = None,
+        load_balancer: elbv2.ApplicationLoadBalancer | None = None,
+        ecs_cluster_in_vpc: ecs.Cluster | None = None,
         **kwargs,
     ):
         super().__init__(scope, construct_id, **kwargs)
-        self.namer = lambda name: f"{construct_id}-{name}"
         self.stack = Stack.of(self)
 
-        assert not (
-            docker_image and docker_build_context
-        ), "docker_image and docker_build_context cannot both be set"
-        assert not (docker_image and docker_build_args), "docker_image and docker_build_args cannot both be set"
-        assert not (docker_image and relative_dockerfile_path), "docker_image and dockerfile_path cannot both be set"
+        # ValueError rather than assert so the validation survives `python -O`
+        if docker_image and any((docker_build_context, docker_build_args, relative_dockerfile_path)):
+            raise ValueError(
+                "docker_image cannot be combined with docker_build_context,"
+                " docker_build_args, or relative_dockerfile_path; pass either a"
+                " pre-built image or the inputs to build one, not both"
+            )
         assert not (vpc_id and ecs_cluster_in_vpc), (
             "vpc_id and ecs_cluster_in_vpc cannot both be set; the vpc associated with the cluster will be used when ecs_cluster_in_vpc is set"
         )
+        # one walk of the mappings; the field lists are reused below instead of
+        # re-extracting them per consumer
+        unpacked_port_mappings = PortMapping.unpack(load_balancer_to_container_port_mappings)
         if not health_check_port:
             ports = load_balancer_to_container_port_mappings
             assert len(ports) == 1, (
@@ -226,7 +248,7 @@ class Webservice(Construct):
             internet_facing=reachable_outside_vpc,
         )
 
-        self.ecs_cluster = ecs_cluster_in_vpc or ecs.Cluster(self, self.namer("Cluster"), vpc=vpc)
+        self.ecs_cluster = ecs_cluster_in_vpc or ecs.Cluster(self, f"{construct_id}-Cluster", vpc=vpc)
 
         task_definition: ecs.FargateTaskDefinition = make_webservice_task_definition(
             scope=self,
@@ -234,8 +256,9 @@ class Webservice(Construct):
             ecs_cpu_size=ecs_cpu_size,
             ecs_memory_limit_mb=ecs_memory_limit_mb,
             log_group=log_group,
-            container_ports=PortMapping.list_container_ports(load_balancer_to_container_port_mappings),
+            container_ports=unpacked_port_mappings.container_ports,
             container_env_vars_overrides=container_env_vars_overrides or {},
+            container_secrets=container_secrets,
             docker_image=docker_image,
             docker_build_context=docker_build_context,
             dockerfile_path=relative_dockerfile_path or Path("Dockerfile"),
@@ -243,7 +266,7 @@ class Webservice(Construct):
             docker_container_command=docker_container_command,
         )
 
-        container_port_to_target_group: Dict[
+        container_port_to_target_group: dict[
             int, elbv2.ApplicationTargetGroup
         ] = make_container_port_to_target_group_mapping(
             scope=scope,
@@ -251,7 +274,7 @@ class Webservice(Construct):
             vpc=vpc,
             health_check_port=health_check_port,
             health_check_path=health_check_path,
-            container_ports=PortMapping.list_container_ports(load_balancer_to_container_port_mappings),
+            container_ports=unpacked_port_mappings.container_ports,
         )
 
         service: ecs.FargateService = make_service(
@@ -260,7 +283,7 @@ class Webservice(Construct):
             desired_task_count=ecs_desired_num_instances,
             task_definition=task_definition,
             ecs_cluster_in_vpc=self.ecs_cluster,
-            target_groups=list(container_port_to_target_group.values()),
+            target_groups=container_port_to_target_group.values(),
             service_security_groups=service_security_groups,
         )
 
@@ -275,12 +298,12 @@ class Webservice(Construct):
             scale_out_cooldown_seconds=scale_out_cooldown_seconds,
         )
 
-        lb_port_to_listener: Dict[int, elbv2.ApplicationListener] = make_load_balancer_listeners(
+        lb_port_to_listener: dict[int, elbv2.ApplicationListener] = make_load_balancer_listeners(
             scope=self,
             id_prefix=construct_id,
             load_balancer=self.load_balancer,
             container_port_to_target_group=container_port_to_target_group,
-            load_balancer_to_container_port_mappings=load_balancer_to_container_port_mappings,
+            unpacked_port_mappings=unpacked_port_mappings,
         )
 
         self.make_output("LoadBalancerUrl", self.load_balancer.load_balancer_dns_name)
@@ -289,7 +312,7 @@ class Webservice(Construct):
         self,
         id: str,
         value: str,
-        description: Optional[str] = None,
+        description: str | None = None,
     ):
         return cdk.CfnOutput(
             self,
@@ -298,26 +321,60 @@ class Webservice(Construct):
             value=value,
         )
 
+# asset images are content-addressed: identical (context, dockerfile, build args)
+# always hash to the same image, so services sharing a Dockerfile can share one
+# asset instead of re-staging (and re-fingerprinting) the build context per service.
+# AssetImage.bind memoizes its DockerImageAsset in the first binding scope, so the
+# cache key includes the app root: an image must never outlive its app's tree.
+_asset_image_cache: dict[
+    tuple[Construct, str, str, tuple[tuple[str, str], ...]], ecs.ContainerImage
+] = {}
+
+
+def _container_image_from_asset(
+    scope: Construct,
+    docker_build_context: str | Path,
+    dockerfile_path: str | Path,
+    docker_build_args: dict[str, str],
+) -> ecs.ContainerImage:
+    cache_key = (
+        scope.node.root,
+        str(docker_build_context),
+        str(dockerfile_path),
+        tuple(sorted(docker_build_args.items())),
+    )
+    image = _asset_image_cache.get(cache_key)
+    if image is None:
+        image = _asset_image_cache[cache_key] = ecs.ContainerImage.from_asset(
+            directory=str(docker_build_context),
+            file=str(dockerfile_path),
+            build_args=docker_build_args,
+            follow_symlinks=SymlinkFollowMode.ALWAYS,
+            platform=ecr_assets.Platform.LINUX_AMD64,
+        )
+    return image
+
+
 def make_webservice_task_definition(
     scope,
     id_prefix: str,
     ecs_cpu_size: int,
     ecs_memory_limit_mb: int,
     log_group: logs.LogGroup,
-    container_ports: List[int],
-    container_env_vars_overrides: Dict[str, str],
-    docker_image: Optional[ecs.ContainerImage] = None,
-    docker_build_context: Optional[Union[str, Path]] = None,
-    dockerfile_path: Optional[Union[str, Path]] = None,
-    docker_build_args: Optional[Dict[str, str]] = None,
-    docker_container_command: Optional[List[str]] = None,
+    container_ports: list[int],
+    container_env_vars_overrides: dict[str, str],
+    container_secrets: dict[str, ecs.Secret] | None = None,
+    docker_image: ecs.ContainerImage | None = None,
+    docker_build_context: str | Path | None = None,
+    dockerfile_path: str | Path | None = None,
+    docker_build_args: dict[str, str] | None = None,
+    docker_container_command: list[str] | None = None,
 ) -> ecs.FargateTaskDefinition:
-    docker_image = docker_image or ecs.ContainerImage.from_asset(
-        directory=docker_build_context and str(docker_build_context),
-        file=str(dockerfile_path),
-        build_args=docker_build_args,
-        follow_symlinks=SymlinkFollowMode.ALWAYS,
-        platform=ecr_assets.Platform.LINUX_AMD64,
+    docker_image = docker_image or _container_image_from_asset(
+        scope=scope,
+        docker_build_context=docker_build_context,
+        dockerfile_path=dockerfile_path,
+        docker_build_args=docker_build_args,
     )
 
     # log stream name: stream-prefix/container-name/ecs-task-id
@@ -334,6 +391,7 @@ def make_webservice_task_definition(
         docker_image=docker_image,
         container_ports=container_ports,
         container_env_vars_overrides=container_env_vars_overrides,
+        container_secrets=container_secrets,
         container_command=docker_container_command,
     )
 
@@ -380,20 +438,18 @@ def _configure_ecs_task_execution_role(scope: Construct, id_prefix: str, executi
     :param id_prefix: prefix for CDK construct IDs created by this function
     :param execution_role: IAM principal which will be granted access; it's the ECS execution role
     """
-    execution_role.add_managed_policy(
-        policy=iam.ManagedPolicy.from_managed_policy_arn(
-            scope,
-            id=f"{id_prefix}-fargate-execution-role-ecr-policy",
-            managed_policy_arn="arn:aws:iam::aws:policy/AmazonEC2ContainerRegistryReadOnly",
-        )
+    managed_policies = (
+        ("ecr", "arn:aws:iam::aws:policy/AmazonEC2ContainerRegistryReadOnly"),
+        ("ecs", "arn:aws:iam::aws:policy/service-role/AmazonECSTaskExecutionRolePolicy"),
     )
-    execution_role.add_managed_policy(
-        policy=iam.ManagedPolicy.from_managed_policy_arn(
-            scope,
-            id=f"{id_prefix}-fargate-execution-role-ecs-policy",
-            managed_policy_arn="arn:aws:iam::aws:policy/service-role/AmazonECSTaskExecutionRolePolicy",
+    for policy_slug, managed_policy_arn in managed_policies:
+        execution_role.add_managed_policy(
+            policy=iam.ManagedPolicy.from_managed_policy_arn(
+                scope,
+                id=f"{id_prefix}-fargate-execution-role-{policy_slug}-policy",
+                managed_policy_arn=managed_policy_arn,
+            )
         )
-    )
 
 
 def make_task_definition(
@@ -402,9 +458,10 @@ def make_task_definition(
     ecs_cpu_size: int,
     ecs_memory_limit_mb: int,
     docker_image: ecs.ContainerImage,
-    container_ports: List[int],
-    container_env_vars_overrides: Dict[str, str],
-    container_command: Optional[List[str]] = None,
+    container_ports: list[int],
+    container_env_vars_overrides: dict[str, str],
+    container_secrets: dict[str, ecs.Secret] | None = None,
+    container_command: list[str] | None = None,
 ) -> ecs.FargateTaskDefinition:
 
     stack = Stack.of(scope)
@@ -424,6 +481,8 @@ def make_task_definition(
         environment={
             **container_env_vars_overrides,
         },
+        # resolved by the ECS agent at task start; never lands in the template in plaintext
+        secrets=container_secrets,
         command=container_command,
     )
 
@@ -436,18 +495,22 @@ def make_container_port_to_target_group_mapping(
     vpc: ec2.Vpc,
     health_check_port: int,
     health_check_path: str,
-    container_ports: List[int],
-) -> Dict[int, elbv2.ApplicationTargetGroup]:
+    container_ports: list[int],
+) -> dict[int, elbv2.ApplicationTargetGroup]:
+    # the health-check port is stringified once here rather than per target group
+    health_check_port_str = str(health_check_port)
+    # dict.fromkeys dedupes while preserving order; a container port exposed through
+    # several listeners only needs (and may only have) one target group
     return {
         port: make_target_group(
             scope=scope,
             id_prefix=id_prefix,
             vpc=vpc,
-            health_check_port=health_check_port,
+            health_check_port_str=health_check_port_str,
             health_check_path=health_check_path,
             port=port,
         )
-        for port in container_ports
+        for port in dict.fromkeys(container_ports)
     }
 
 
@@ -455,7 +518,7 @@ def make_target_group(
     scope: Construct,
     id_prefix: str,
     vpc: ec2.Vpc,
-    health_check_port: int,
+    health_check_port_str: str,
     health_check_path: str,
     port: int,
 ) -> elbv2.ApplicationTargetGroup:
@@ -469,7 +532,7 @@ def make_target_group(
     )
 
     target_group.configure_health_check(
-        port=str(health_check_port),
+        port=health_check_port_str,
         path=health_check_path,
         protocol=elbv2.Protocol.HTTP,
     )
@@ -483,8 +546,8 @@ def make_service(
     desired_task_count: int,
     task_definition: ecs.FargateTaskDefinition,
     ecs_cluster_in_vpc: ecs.Cluster,
-    target_groups: List[elbv2.ApplicationTargetGroup],
-    service_security_groups: Optional[List[ec2.SecurityGroup]] = None,
+    target_groups: Iterable[elbv2.ApplicationTargetGroup],
+    service_security_groups: list[ec2.SecurityGroup] | None = None,
 ) -> ecs.FargateService:
     """
     Create a fargate service to run the ``task_definition``.
@@ -533,53 +596,86 @@ def make_service(
     return service
 
 
+# Vpc.from_lookup registers a context-provider query (and, on a cold cdk.context.json,
+# AWS describe calls) per call; within one synth the same (stack, region, vpc_id)
+# always resolves to the same VPC, so share the construct across Webservices.
+# Keyed by the Stack object itself (not node.addr, which is a hash of the construct
+# path and collides across App instances in the same process).
+_vpc_lookup_cache: dict[tuple[Stack, str, str], ec2.IVpc] = {}
+
+
 def create_or_lookup_vpc(
     scope: Construct,
     id_prefix: str,
-    vpc_id: Optional[str] = None,
+    vpc_id: str | None = None,
 ) -> ec2.Vpc:
     stack = Stack.of(scope)
 
-    vpc: Optional[ec2.Vpc] = vpc_id and ec2.Vpc.from_lookup(
-        scope, f"{id_prefix}Vpc", region=stack.region, vpc_id=vpc_id
-    )
-
-    vpc: ec2.Vpc = vpc or ec2.Vpc(
-        scope=scope,
-        id=f"{id_prefix}Vpc",
-        enable_dns_support=True,
-        enable_dns_hostnames=True,
-    )
+    if vpc_id:
+        lookup_key = (stack, stack.region, vpc_id)
+        vpc = _vpc_lookup_cache.get(lookup_key)
+        if vpc is None:
+            vpc = _vpc_lookup_cache[lookup_key] = ec2.Vpc.from_lookup(
+                scope, f"{id_prefix}Vpc", region=stack.region, vpc_id=vpc_id
+            )
+    else:
+        vpc = ec2.Vpc(
+            scope=scope,
+            id=f"{id_prefix}Vpc",
+            enable_dns_support=True,
+            enable_dns_hostnames=True,
+        )
 
     return vpc
 
 def make_load_balancer_listeners(
     scope: Construct,
     id_prefix: str,
-    load_balancer_to_container_port_mappings: List[PortMapping],
-    container_port_to_target_group: Dict[int, elbv2.ApplicationTargetGroup],
+    unpacked_port_mappings: _UnpackedPortMappings,
+    container_port_to_target_group: dict[int, elbv2.ApplicationTargetGroup],
     load_balancer: elbv2.ApplicationLoadBalancer,
-) -> Dict[int, elbv2.ApplicationListener]:
+) -> dict[int, elbv2.ApplicationListener]:
     """
     Create one load balancer listener per exposed container port (and therefore per target group).
-    
+
     See ``make_load_balancer_listener()`` for more context.
     """
-    
-    listener_port_to_listener: Dict[int, elbv2.ApplicationListener] = {}
-    for port_mapping in load_balancer_to_container_port_mappings:
-        container_port_target_group: elbv2.ApplicationTargetGroup = container_port_to_target_group[port_mapping.container_port]
-        listener_port_to_listener[port_mapping.listener_port] = make_load_balancer_listener(
+
+    return {
+        listener_port: make_load_balancer_listener(
             scope=scope,
             id_prefix=id_prefix,
             load_balancer=load_balancer,
-            listener_port=port_mapping.listener_port,
-            path_pattern=port_mapping.path_pattern,
-            target_group=container_port_target_group,
+            listener_port=listener_port,
+            path_pattern=path_pattern,
+            target_group=container_port_to_target_group[container_port],
         )
+        for listener_port, container_port, path_pattern in zip(
+            unpacked_port_mappings.listener_ports,
+            unpacked_port_mappings.container_ports,
+            unpacked_port_mappings.path_patterns,
+        )
+    }
 
 
-    return listener_port_to_listener
+# Several Webservices can share one ALB (the Metaflow services do); a second listener
+# on an already-used port would be a deploy-time conflict, and a listener per service
+# bloats the synth graph. Listeners are therefore cached per (alb, port) so services
+# sharing a port attach path-pattern rules to the same listener; each listener hands
+# out unique rule priorities from its own counter. Keyed by the ALB object itself:
+# node.addr would collide across App instances in one process, silently reusing a
+# listener (and its priority counter) from a previous app's tree.
+_listener_cache: dict[tuple[elbv2.ApplicationLoadBalancer, int], elbv2.ApplicationListener] = {}
+_next_rule_priority: dict[tuple[elbv2.ApplicationLoadBalancer, int], int] = {}
+
+# every listener's fallback response is identical; the kwargs are shared but the
+# ListenerAction itself is built per listener (jsii objects shouldn't be reused
+# across constructs)
+_DEFAULT_404_ACTION_KWARGS = dict(
+    content_type="text/html",
+    message_body="Sorry mate! 404 Page not found.",
+    status_code=404,
+)
 
 
 def make_load_balancer_listener(
@@ -591,27 +687,33 @@ def make_load_balancer_listener(
     target_group: elbv2.ApplicationTargetGroup,
 ) -> elbv2.ApplicationListener:
     """
-    Create a listener for a single port with a rule that sends all requests to the specified target group.
-    
+    Create (or reuse) a listener for a single port, adding a rule that sends matching requests to the target group.
+
     Think of this listener as creating the mapping: ``alb:<container port> -> trg grp:<target group port>``.
     Target groups are configured with exactly one port, so the ``container_port`` parameter refers
     to the port that the listener is listening on.
+
+    The listener itself is shared: if another service already created a listener on
+    ``listener_port`` for this ``load_balancer``, only a new listener rule is added.
     """
 
-    listener = elbv2.ApplicationListener(
-        scope,
-        f"{id_prefix}Listener",
-        port=listener_port,
-        # TODO: get a cert and make this HTTPS
-        protocol=elbv2.ApplicationProtocol.HTTP,
-        load_balancer=load_balancer,
-        default_action=elbv2.ListenerAction.fixed_response(
-            content_type="text/html",
-            message_body="Sorry mate! 404 Page not found.",
-            status_code=404,
-        ),
-        certificates=[],
-    )
+    listener_key = (load_balancer, listener_port)
+    listener = _listener_cache.get(listener_key)
+    if listener is None:
+        listener = _listener_cache[listener_key] = elbv2.ApplicationListener(
+            scope,
+            f"{id_prefix}Listener",
+            port=listener_port,
+            # TODO: get a cert and make this HTTPS
+            protocol=elbv2.ApplicationProtocol.HTTP,
+            load_balancer=load_balancer,
+            default_action=elbv2.ListenerAction.fixed_response(**_DEFAULT_404_ACTION_KWARGS),
+            certificates=[],
+        )
+        _next_rule_priority[listener_key] = 2
+
+    priority = _next_rule_priority[listener_key]
+    _next_rule_priority[listener_key] = priority + 1
 
     elbv2.ApplicationListenerRule(
         scope,
@@ -622,7 +724,7 @@ def make_load_balancer_listener(
             # other listeners can override this
             elbv2.ListenerCondition.path_patterns(values=[path_pattern])
         ],
-        priority=2,
+        priority=priority,
         action=elbv2.ListenerAction.forward(target_groups=[target_group]),
     )
 
@@ -4,7 +4,11 @@ import aws_cdk.cloudformation_include as cfn_include
 from pathlib import Path
 
 THIS_DIR = Path(__file__).parent
-TEMPLATE_FPATH = THIS_DIR / "./cdk_metaflow/official-metaflow-template.yml"
+# resolved once at import: CfnInclude only accepts template_file (it does its own
+# YAML parse with CFN short-form tags), so the path string is the part we can hoist
+# out of the per-stack constructor for multi-stack apps
+TEMPLATE_FPATH = (THIS_DIR / "cdk_metaflow/official-metaflow-template.yml").resolve()
+TEMPLATE_FILE = str(TEMPLATE_FPATH)
 
 # for development, use account/region from cdk cli
 os.environ["AWS_PROFILE"] = "mlops-club"
@@ -18,7 +22,7 @@ class OfficialMetaflowStack(Stack):
         cfn_include.CfnInclude(
             self, 
             "official-metaflow-template", 
-            template_file=str(TEMPLATE_FPATH),
+            template_file=TEMPLATE_FILE,
             parameters={"EnableUI": "true"},
         )
 
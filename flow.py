@@ -1,9 +1,10 @@
 from metaflow import FlowSpec, step, conda_base
 
+_CONDA_LIBS = {"rich": "12.6.0"}
+
 @conda_base(
-    libraries={"rich": "12.6.0"},
+    libraries=_CONDA_LIBS,
     python="3.10.4",
-
 )
 class MLOpsClubFlow(FlowSpec):
 